@@ -0,0 +1,87 @@
+"""Shared fixtures for tests driving midi2cmd against the virtual MIDI device."""
+
+import subprocess
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+type Starter = Callable[..., subprocess.Popen]
+
+
+@pytest.fixture
+def virtual_device_script() -> Path:
+    """Return path to virtual MIDI device script."""
+    return Path(__file__).parent.parent / "virtual_midi_device.py"
+
+
+@pytest.fixture
+def processes() -> Iterator[list[subprocess.Popen]]:
+    """Collect started processes and terminate those still running at teardown."""
+    procs: list[subprocess.Popen] = []
+    yield procs
+    for proc in procs:
+        if proc.poll() is None:
+            proc.terminate()
+            proc.wait(timeout=2)
+
+
+@pytest.fixture
+def start_virtual_device(
+    virtual_device_script: Path, processes: list[subprocess.Popen]
+) -> Starter:
+    """Return a function that starts the virtual MIDI device with a given env."""
+
+    def start(env: dict[str, str]) -> subprocess.Popen:
+        device = subprocess.Popen(
+            ["uv", "run", "python3", str(virtual_device_script)],
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        processes.append(device)
+
+        # Give the virtual device time to create the MIDI port
+        time.sleep(2.0)
+
+        if device.poll() is not None:
+            stdout, stderr = device.communicate()
+            pytest.fail(
+                f"Virtual device failed to start:\nstdout: {stdout}\nstderr: {stderr}"
+            )
+        return device
+
+    return start
+
+
+@pytest.fixture
+def start_midi2cmd(processes: list[subprocess.Popen]) -> Starter:
+    """Return a function that starts `midi2cmd run` with a given config."""
+
+    def start(
+        config_path: Path, env: dict[str, str], **kwargs: Any
+    ) -> subprocess.Popen:
+        kwargs.setdefault("stdout", subprocess.PIPE)
+        kwargs.setdefault("stderr", subprocess.PIPE)
+        midi2cmd = subprocess.Popen(
+            [
+                "uv",
+                "run",
+                "python3",
+                "-m",
+                "midi2cmd.console",
+                "run",
+                "--config",
+                str(config_path),
+            ],
+            env=env,
+            text=True,
+            **kwargs,
+        )
+        processes.append(midi2cmd)
+        return midi2cmd
+
+    return start
@@ -0,0 +1,210 @@
+"""Load tests for midi2cmd using virtual MIDI device in load mode."""
+
+import os
+import signal
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import IO
+
+import pytest
+
+pytestmark = pytest.mark.load
+
+# Rate of the paced cases; midi2cmd must sustain it when unpaced too
+PACED_RATE = 200
+
+
+@pytest.fixture
+def load_config_path():
+    """Return path to load test config file."""
+    return Path(__file__).parent / "fixtures" / "load.config.txt"
+
+
+def read_lines(stream: IO[str], lines: list[tuple[float, str]]) -> None:
+    """Append each line read from `stream` to `lines`, with its read time."""
+    for line in iter(stream.readline, ""):
+        lines.append((time.time(), line.strip()))
+
+
+def parse_sent(output: str) -> list[tuple[str, str, float]]:
+    """Parse 'SENT <label> <value> <timestamp>' lines into tuples."""
+    events = []
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) == 4 and fields[0] == "SENT":
+            events.append((fields[1], fields[2], float(fields[3])))
+    return events
+
+
+def parse_received(lines: list[tuple[float, str]]) -> list[tuple[str, str, float]]:
+    """Parse timestamped 'RECV <label> <value>' lines into tuples."""
+    events = []
+    for received_at, line in lines:
+        fields = line.split()
+        if len(fields) == 3 and fields[0] == "RECV":
+            events.append((fields[1], fields[2], received_at))
+    return events
+
+
+def match_events(
+    sent: list[tuple[str, str, float]], received: list[tuple[str, str, float]]
+) -> tuple[list[float], int, int]:
+    """
+    Pair each received event with the oldest unmatched sent one with the same
+    label and value, so a lost or unexpected message doesn't affect the rest.
+
+    Returns the latencies of the paired events, the number of sent events never
+    received (drops) and of received events never sent (mismatches).
+    """
+    pending: defaultdict[tuple[str, str], deque[float]] = defaultdict(deque)
+    for label, value, sent_at in sent:
+        pending[label, value].append(sent_at)
+
+    latencies = []
+    mismatches = 0
+    for label, value, received_at in received:
+        queue = pending.get((label, value))
+        if queue:
+            latencies.append(received_at - queue.popleft())
+        else:
+            mismatches += 1
+
+    drops = sum(len(queue) for queue in pending.values())
+    return latencies, drops, mismatches
+
+
+@pytest.mark.parametrize(
+    "mix, rate, burst",
+    [
+        ("cc_sweep", PACED_RATE, 1),
+        ("pitchwheel_ramp", PACED_RATE, 1),
+        ("mixed", PACED_RATE, 32),
+        ("mixed", 0, 1),
+    ],
+)
+def test_midi2cmd_load_with_virtual_device(
+    mix, rate, burst, load_config_path, start_virtual_device, start_midi2cmd, tmp_path
+):
+    """
+    Test midi2cmd drops, throughput and latency under generated load.
+
+    Paced cases must keep up with the send rate; unbursted ones must also keep
+    p95 latency under LOAD_MAX_P95_MS. The unpaced case measures midi2cmd's
+    capacity, which must be at least LOAD_MIN_RATE.
+    """
+    count = int(os.environ.get("LOAD_COUNT", "500"))
+    if count < 1:
+        pytest.fail(f"LOAD_COUNT must be at least 1, got {count}")
+    max_drops = int(os.environ.get("LOAD_MAX_DROPS", "0"))
+    min_rate = float(os.environ.get("LOAD_MIN_RATE", str(PACED_RATE)))
+    min_ratio = float(os.environ.get("LOAD_MIN_RATIO", "0.9"))
+    max_p95_ms = float(os.environ.get("LOAD_MAX_P95_MS", "50"))
+    timeout = float(os.environ.get("LOAD_TIMEOUT", "60"))
+
+    env = os.environ.copy()
+    env.update(
+        WAIT_MODE="load",
+        LOAD_MIX=mix,
+        LOAD_RATE=str(rate),
+        LOAD_BURST=str(burst),
+        LOAD_COUNT=str(count),
+    )
+
+    virtual_device = start_virtual_device(env)
+
+    # Echoed lines are timestamped as they are read, so commands only echo
+    stderr_path = tmp_path / "midi2cmd.err"
+    with stderr_path.open("w") as errors:
+        midi2cmd = start_midi2cmd(load_config_path, env, stderr=errors)
+    lines: list[tuple[float, str]] = []
+    reader = threading.Thread(
+        target=read_lines, args=(midi2cmd.stdout, lines), daemon=True
+    )
+    reader.start()
+
+    def midi2cmd_stderr() -> str:
+        return f"\nmidi2cmd stderr:\n{stderr_path.read_text()}"
+
+    # Send warm-up messages until midi2cmd echoes one back
+    deadline = time.monotonic() + timeout
+    while not any(line == "READY" for _, line in lines):
+        if midi2cmd.poll() is not None:
+            pytest.fail(f"midi2cmd exited before the load{midi2cmd_stderr()}")
+        if time.monotonic() > deadline:
+            pytest.fail(f"midi2cmd never received warm-up{midi2cmd_stderr()}")
+        virtual_device.send_signal(signal.SIGUSR1)
+        time.sleep(0.2)
+
+    # Let queued warm-up messages drain so they don't delay the load
+    settled = -1
+    while len(lines) != settled:
+        settled = len(lines)
+        time.sleep(0.5)
+
+    # Start the load and wait until every message is sent
+    virtual_device.send_signal(signal.SIGUSR2)
+    device_stdout, device_stderr = virtual_device.communicate(timeout=timeout)
+    sent = parse_sent(device_stdout)
+    assert len(sent) == count, f"Device sent {len(sent)}/{count}:\n{device_stderr}"
+
+    # Wait until midi2cmd has handled everything, or stops making progress
+    deadline = time.monotonic() + timeout
+    received_count = -1
+    while time.monotonic() < deadline:
+        received = parse_received(lines)
+        if len(received) >= count or len(received) == received_count:
+            break
+        received_count = len(received)
+        time.sleep(1.0)
+
+    midi2cmd.terminate()
+    midi2cmd.wait(timeout=2)
+    reader.join(timeout=2)
+
+    received = parse_received(lines)
+    latencies, drops, mismatches = match_events(sent, received)
+    latencies.sort()
+
+    elapsed = received[-1][2] - sent[0][2] if received else float("inf")
+    throughput = len(received) / elapsed
+    send_rate = count / max(sent[-1][2] - sent[0][2], 1e-9)
+    p95_ms = latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0
+
+    print(
+        f"\n[{mix} @ {rate or 'max'} msg/s, burst {burst}] "
+        f"sent={count} ({send_rate:.0f} msg/s) "
+        f"received={len(received)} drops={drops} mismatches={mismatches} "
+        f"throughput={throughput:.1f} msg/s"
+    )
+    if latencies:
+        print(
+            f"    latency ms: "
+            f"min={latencies[0] * 1000:.2f} "
+            f"p50={latencies[len(latencies) // 2] * 1000:.2f} "
+            f"p95={p95_ms:.2f} "
+            f"max={latencies[-1] * 1000:.2f}"
+        )
+
+    assert (
+        mismatches == 0
+    ), f"Received {mismatches} messages that were not sent{midi2cmd_stderr()}"
+    assert (
+        drops <= max_drops
+    ), f"Dropped {drops} messages (max {max_drops}){midi2cmd_stderr()}"
+
+    if rate:
+        assert throughput >= min_ratio * send_rate, (
+            f"Throughput {throughput:.1f} msg/s can't keep up with "
+            f"{send_rate:.1f} msg/s sent{midi2cmd_stderr()}"
+        )
+        # Within a burst, messages queue behind each other by design
+        if burst == 1:
+            assert (
+                p95_ms <= max_p95_ms
+            ), f"p95 latency {p95_ms:.2f} ms above {max_p95_ms} ms"
+    else:
+        assert (
+            throughput >= min_rate
+        ), f"Throughput {throughput:.1f} msg/s below {min_rate} msg/s"
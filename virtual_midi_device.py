@@ -15,22 +15,48 @@ Usage:
     # Pause mode (automatically send messages every 1 second):
     WAIT_MODE=pause python3 virtual_midi_device.py
 
+    # Load mode (send a warm-up message on each SIGUSR1, then a generated
+    # message mix on SIGUSR2):
+    WAIT_MODE=load LOAD_MIX=cc_sweep LOAD_COUNT=1000 LOAD_RATE=500 \\
+        python3 virtual_midi_device.py
+
 Default mode is 'key' if WAIT_MODE is not set.
+
+Load mode is configured with these environment variables:
+
+    LOAD_MIX    cc_sweep, pitchwheel_ramp or mixed (default: mixed)
+    LOAD_COUNT  number of messages to send (default: 1000)
+    LOAD_RATE   target messages/sec; 0 sends as fast as possible (default: 0)
+    LOAD_BURST  messages sent back-to-back per burst, for any mix (default: 1)
+    LOAD_SEED   seed for the random generator (default: 0)
+
+The warm-up message (control_change channel=10 control=119) lets a reader
+confirm it is subscribed to the port before the load starts.
+
+After sending, one line per message is printed to stdout:
+
+    SENT <label> <value> <timestamp>
+
+where <label> is 'pw' for pitchwheel or 'cc<control>' for control_change.
 """
 
 import os
+import random
 import signal
+import sys
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from typing import Literal
 
 import mido
 from mido import Message  # type: ignore[import-untyped]
 
+from midi2cmd.utils import get_value
+
 PORT_NAME = "miditest"
 
-# Wait mode: 'signal', 'key', or 'pause'
+# Wait mode: 'signal', 'key', 'pause', or 'load'
 # Can be overridden by WAIT_MODE environment variable
 WAIT_MODE = os.environ.get("WAIT_MODE", "key")
 
@@ -43,6 +69,62 @@ MESSAGES = [
     mido.Message("control_change", channel=10, control=1, value=1),
 ]
 
+# Channel and controls used by load mode; must match tests/fixtures/load.config.txt
+LOAD_CHANNEL = 10
+LOAD_CONTROLS = [1, 9, 18, 26]
+WARMUP_MESSAGE = mido.Message("control_change", channel=LOAD_CHANNEL, control=119)
+
+PITCHWHEEL_STEP = 256
+
+
+def cc_sweeps(rng: random.Random) -> Iterator[Message]:
+    """Endless sweeps over the full value range of randomly chosen controls."""
+    while True:
+        control = rng.choice(LOAD_CONTROLS)
+        values = range(128) if rng.random() < 0.5 else range(127, -1, -1)
+        for value in values:
+            yield mido.Message(
+                "control_change", channel=LOAD_CHANNEL, control=control, value=value
+            )
+
+
+def pitchwheel_ramps(rng: random.Random) -> Iterator[Message]:
+    """Endless up-and-down ramps over the full pitchwheel range."""
+    up = [
+        *range(mido.MIN_PITCHWHEEL, mido.MAX_PITCHWHEEL, PITCHWHEEL_STEP),
+        mido.MAX_PITCHWHEEL,
+    ]
+    while True:
+        for pitch in [*up, *reversed(up[1:-1])]:
+            yield mido.Message("pitchwheel", channel=LOAD_CHANNEL, pitch=pitch)
+
+
+def mixed(rng: random.Random) -> Iterator[Message]:
+    """Randomly interleave CC sweeps and pitchwheel ramps."""
+    sources = [cc_sweeps(rng), pitchwheel_ramps(rng)]
+    while True:
+        yield next(rng.choice(sources))
+
+
+LOAD_MIXES: dict[str, Callable[[random.Random], Iterator[Message]]] = {
+    "cc_sweep": cc_sweeps,
+    "pitchwheel_ramp": pitchwheel_ramps,
+    "mixed": mixed,
+}
+
+
+def load_messages(mix: str, count: int, seed: int = 0) -> list[Message]:
+    """Generate `count` messages for the given load mix."""
+    source = LOAD_MIXES[mix](random.Random(seed))
+    return [next(source) for _ in range(count)]
+
+
+def load_label(message: Message) -> str:
+    """Short identifier of a message, as echoed by tests/fixtures/load.config.txt."""
+    if message.type == "pitchwheel":
+        return "pw"
+    return f"cc{message.control}"
+
 
 @dataclass
 class VirtualMidiDevice:
@@ -84,11 +166,71 @@ class VirtualMidiDevice:
                 wait_func()
                 port.send(msg)
 
+    def run_load(
+        self,
+        messages: list[Message],
+        rate: float = 0,
+        burst_size: int = 1,
+    ) -> list[float]:
+        """
+        Create virtual MIDI port, send WARMUP_MESSAGE on each SIGUSR1 and,
+        after SIGUSR2, send all messages.
+
+        Messages are sent in bursts of `burst_size`, paced so the average
+        rate is `rate` messages/sec; a rate of 0 sends as fast as possible.
+        Returns the wall-clock send time of each message.
+        """
+        # Block the signals so none is lost (or kills us) before sigwait()
+        signals = {signal.SIGUSR1, signal.SIGUSR2}
+        signal.pthread_sigmask(signal.SIG_BLOCK, signals)
+
+        sent_at: list[float] = []
+        with mido.open_output(self.port_name, virtual=True) as port:
+            while signal.sigwait(signals) == signal.SIGUSR1:
+                port.send(WARMUP_MESSAGE)
+            start = time.perf_counter()
+            for i in range(0, len(messages), burst_size):
+                if rate > 0:
+                    delay = start + i / rate - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                for msg in messages[i : i + burst_size]:
+                    port.send(msg)
+                    sent_at.append(time.time())
+        return sent_at
+
+
+def run_load_from_env(device: VirtualMidiDevice) -> None:
+    """Run load mode as configured by LOAD_* environment variables."""
+    mix = os.environ.get("LOAD_MIX", "mixed")
+    if mix not in LOAD_MIXES:
+        sys.exit(f"Unknown LOAD_MIX '{mix}'. Valid mixes: {', '.join(LOAD_MIXES)}.")
+
+    count = int(os.environ.get("LOAD_COUNT", "1000"))
+    if count < 1:
+        sys.exit(f"LOAD_COUNT must be at least 1, got {count}.")
+    rate = float(os.environ.get("LOAD_RATE", "0"))
+    if rate < 0:
+        sys.exit(f"LOAD_RATE must be 0 or positive, got {rate}.")
+    burst_size = int(os.environ.get("LOAD_BURST", "1"))
+    if burst_size < 1:
+        sys.exit(f"LOAD_BURST must be at least 1, got {burst_size}.")
+
+    messages = load_messages(
+        mix, count=count, seed=int(os.environ.get("LOAD_SEED", "0"))
+    )
+    sent_at = device.run_load(messages, rate=rate, burst_size=burst_size)
+    for msg, t in zip(messages, sent_at):
+        print(f"SENT {load_label(msg)} {get_value(msg)} {t:.6f}")
+
 
 def main() -> None:
     """Create a virtual MIDI port and send messages."""
     device = VirtualMidiDevice(port_name=PORT_NAME)
-    device.run(messages=MESSAGES, wait_mode=WAIT_MODE)  # type: ignore[arg-type]
+    if WAIT_MODE == "load":
+        run_load_from_env(device)
+    else:
+        device.run(messages=MESSAGES, wait_mode=WAIT_MODE)  # type: ignore[arg-type]
 
 
 if __name__ == "__main__":